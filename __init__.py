@@ -1,7 +1,20 @@
 """
 llm_contract: Lead extraction from raw text via LLM with strict contract.
 """
-from llm_contract.extractor import extract_lead, LLMCall
+from llm_contract.extractor import (
+    aclose_client,
+    clear_cache,
+    close_client,
+    extract_lead,
+    extract_lead_async,
+    extract_leads,
+    extract_leads_async,
+    extract_leads_packed,
+    LLMCall,
+    AsyncLLMCall,
+    PackedLLMCall,
+)
+from llm_contract.batch import BatchStatus, submit_batch, poll_batch, collect_results
 from llm_contract.schemas import LeadExtraction, Result, Ok, Err
 from llm_contract.errors import (
     EmptyLead,
@@ -10,11 +23,25 @@ from llm_contract.errors import (
     ModelInvalidOutput,
     LLMTimeoutError,
     ProviderError,
+    RateLimited,
 )
 
 __all__ = [
     "extract_lead",
+    "extract_lead_async",
+    "extract_leads",
+    "extract_leads_async",
+    "extract_leads_packed",
     "LLMCall",
+    "AsyncLLMCall",
+    "PackedLLMCall",
+    "aclose_client",
+    "clear_cache",
+    "close_client",
+    "BatchStatus",
+    "submit_batch",
+    "poll_batch",
+    "collect_results",
     "LeadExtraction",
     "Result",
     "Ok",
@@ -25,4 +52,5 @@ __all__ = [
     "ModelInvalidOutput",
     "LLMTimeoutError",
     "ProviderError",
+    "RateLimited",
 ]
@@ -0,0 +1,193 @@
+"""
+OpenAI Batch API path for large offline jobs: about half the cost of synchronous calls,
+completed asynchronously within 24h. Results go through the same parse, validation and
+empty-lead policy as extract_lead(); raw LLM output is never returned.
+"""
+from __future__ import annotations
+
+import io
+import json
+import logging
+import time
+from enum import Enum
+from typing import Any
+
+from llm_contract.errors import ExtractorError, ModelInvalidOutput, ProviderError
+from llm_contract.extractor import (
+    LEAD_RESPONSE_FORMAT,
+    _build_messages,
+    _get_client,
+    _loads,
+    _model_name,
+    _provider_error,
+    _validate_lead,
+)
+from llm_contract.schemas import Result, Ok, Err
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+BATCH_COMPLETION_WINDOW = "24h"
+DEFAULT_POLL_INTERVAL_SEC = 30.0
+
+# custom_id of each request line; the suffix is the index of the text in the submitted list.
+_CUSTOM_ID_PREFIX = "lead-"
+# Batch metadata key holding len(texts): request_counts.total is 0 if validation failed.
+_TOTAL_METADATA_KEY = "total_requests"
+
+
+class BatchStatus(str, Enum):
+    """Lifecycle states of an OpenAI batch job."""
+
+    VALIDATING = "validating"
+    FAILED = "failed"
+    IN_PROGRESS = "in_progress"
+    FINALIZING = "finalizing"
+    COMPLETED = "completed"
+    EXPIRED = "expired"
+    CANCELLING = "cancelling"
+    CANCELLED = "cancelled"
+
+
+TERMINAL_STATUSES = frozenset(
+    {BatchStatus.COMPLETED, BatchStatus.FAILED, BatchStatus.EXPIRED, BatchStatus.CANCELLED}
+)
+
+
+def _request_line(index: int, text: str) -> dict[str, Any]:
+    return {
+        "custom_id": f"{_CUSTOM_ID_PREFIX}{index}",
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": {
+            "model": _model_name(),
+            "messages": _build_messages(text),
+            "response_format": LEAD_RESPONSE_FORMAT,
+        },
+    }
+
+
+def submit_batch(texts: list[str]) -> str:
+    """Upload one request per text and start a batch job. Returns the batch id. Raises ExtractorError."""
+    client = _get_client()
+    jsonl = "".join(json.dumps(_request_line(i, t)) + "\n" for i, t in enumerate(texts))
+
+    try:
+        input_file = client.files.create(
+            file=("leads.jsonl", io.BytesIO(jsonl.encode())),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=BATCH_ENDPOINT,
+            completion_window=BATCH_COMPLETION_WINDOW,
+            metadata={_TOTAL_METADATA_KEY: str(len(texts))},
+        )
+    except Exception as e:
+        raise _provider_error(e)
+
+    logger.info("submitted batch %s with %d requests", batch.id, len(texts))
+    return batch.id
+
+
+def _retrieve(batch_id: str) -> Any:
+    try:
+        return _get_client().batches.retrieve(batch_id)
+    except Exception as e:
+        raise _provider_error(e)
+
+
+def poll_batch(
+    batch_id: str,
+    *,
+    interval_sec: float = DEFAULT_POLL_INTERVAL_SEC,
+    timeout_sec: float | None = None,
+) -> BatchStatus:
+    """
+    Wait until the batch reaches a terminal status and return it. With timeout_sec, returns
+    the current (possibly non-terminal) status once that much time has passed.
+    Raises ExtractorError.
+    """
+    start = time.monotonic()
+    while True:
+        status = BatchStatus(_retrieve(batch_id).status)
+        if status in TERMINAL_STATUSES:
+            return status
+        if timeout_sec is not None and time.monotonic() - start + interval_sec > timeout_sec:
+            return status
+        logger.info("batch %s is %s; polling again in %.0fs", batch_id, status.value, interval_sec)
+        time.sleep(interval_sec)
+
+
+def _result_from_record(record: dict[str, Any]) -> Result:
+    """Map one output/error file line to a Result, applying the extract_lead contract."""
+    try:
+        return _result_from_response(record)
+    except (AttributeError, IndexError, KeyError, TypeError) as e:
+        return Err(ModelInvalidOutput(f"Malformed batch record: {e!r}"))
+
+
+def _result_from_response(record: dict[str, Any]) -> Result:
+    response = record.get("response") or {}
+    if record.get("error") or response.get("status_code") != 200:
+        error = record.get("error") or (response.get("body") or {}).get("error") or {}
+        return Err(ProviderError(error.get("message") or "Batch request failed"))
+
+    try:
+        choices = response["body"].get("choices") or []
+        content = ((choices[0].get("message") or {}).get("content") or "").strip() if choices else ""
+        if not content:
+            raise ModelInvalidOutput("Empty message content")
+        return Ok(_validate_lead(content))
+    except ExtractorError as e:
+        return Err(e)
+
+
+def _total_requests(batch: Any) -> int:
+    """Number of submitted texts: from our metadata, else the server's request count."""
+    metadata = getattr(batch, "metadata", None) or {}
+    try:
+        return int(metadata[_TOTAL_METADATA_KEY])
+    except (KeyError, TypeError, ValueError):
+        return batch.request_counts.total if batch.request_counts else 0
+
+
+def collect_results(batch_id: str) -> list[Result]:
+    """
+    Return one Result per submitted text, in submission order, for a finished batch.
+    Requests with no line in the output or error file (e.g. an expired batch, or one that
+    failed validation) become Err(ProviderError); a malformed line becomes Err for its own
+    request only. Raises ExtractorError if the batch is still running.
+    """
+    batch = _retrieve(batch_id)
+    status = BatchStatus(batch.status)
+    if status not in TERMINAL_STATUSES:
+        raise ProviderError(f"Batch {batch_id} is {status.value}; poll until it finishes")
+
+    total = _total_requests(batch)
+    results: list[Result] = [
+        Err(ProviderError(f"No result for request in batch {status.value}")) for _ in range(total)
+    ]
+
+    client = _get_client()
+    for file_id in (batch.output_file_id, batch.error_file_id):
+        if not file_id:
+            continue
+        try:
+            lines = list(client.files.content(file_id).iter_lines())
+        except Exception as e:
+            raise _provider_error(e)
+        for line in lines:
+            if not line.strip():
+                continue
+            # A bad line only affects its own request; the rest of the file is still used.
+            try:
+                record = _loads(line)
+                index = int(record["custom_id"].removeprefix(_CUSTOM_ID_PREFIX))
+            except (AttributeError, KeyError, TypeError, ValueError) as e:
+                logger.warning("skipping unreadable line in batch file %s: %r", file_id, e)
+                continue
+            if 0 <= index < total:
+                results[index] = _result_from_record(record)
+
+    return results
@@ -13,6 +13,7 @@ class FailureKind(str, Enum):
     MODEL_INVALID_OUTPUT = "MODEL_INVALID_OUTPUT"
     TIMEOUT = "TIMEOUT"
     PROVIDER_ERROR = "PROVIDER_ERROR"
+    RATE_LIMITED = "RATE_LIMITED"
     EMPTY_LEAD = "EMPTY_LEAD"
 
 
@@ -45,11 +46,17 @@ class LLMTimeoutError(ExtractorError):
 
 
 class ProviderError(ExtractorError):
-    """API / provider error (auth, rate limit, etc.). Not retried."""
+    """API / provider error (auth, bad request, etc.). Not retried."""
 
     failure_type = FailureKind.PROVIDER_ERROR
 
 
+class RateLimited(ExtractorError):
+    """Provider rate limit hit (HTTP 429). Retried with backoff."""
+
+    failure_type = FailureKind.RATE_LIMITED
+
+
 class EmptyLead(ExtractorError):
     """Valid extraction but no contact info (no email and no phone). Policy: do not return Ok."""
 
@@ -4,80 +4,374 @@ LLM call is isolated: inject llm_call to avoid side effects (network, env) in te
 """
 from __future__ import annotations
 
+import asyncio
+import atexit
+import hashlib
 import json
 import logging
 import os
+import threading
 import time
-from typing import Callable
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable
 
 from pydantic import ValidationError
 
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:  # optional speedup; _loads + dict is the fallback
+    msgspec = None
+
 from llm_contract.errors import (
     EmptyLead,
     ExtractorError,
     ModelInvalidOutput,
     LLMTimeoutError,
     ProviderError,
+    RateLimited,
 )
 from llm_contract.retry import (
+    RateLimiter,
     is_retriable,
     backoff_delay,
     with_retry,
     log_attempt_failure,
     MAX_RETRIES,
 )
-from llm_contract.schemas import LeadExtraction, Result, Ok, Err
+from llm_contract.schemas import PHONE_DIGITS_MIN, LeadExtraction, Result, Ok, Err
 
 logger = logging.getLogger(__name__)
 
+# SDK exception class -> typed failure, built on first use (see _exc_map()) so importing
+# this module does not pull in openai/httpx.
+_EXC_MAP: dict[type[BaseException], type[ExtractorError]] | None = None
+
 # Prompt discipline: only instruct format; schema enforces structure.
 EXTRACTION_SYSTEM = """You extract lead fields from raw text. Return ONLY valid JSON.
 Use exactly these keys: name, email, phone. Use null for any missing value.
 Do not add other keys or text."""
 
-EXTRACTION_USER_TEMPLATE = """Extract lead data from this text. Return ONLY valid JSON with keys: name, email, phone. Use null for missing values.
+# User message is EXTRACTION_USER_PREFIX + text + "\n": plain concatenation, no per-call format().
+EXTRACTION_USER_PREFIX = """Extract lead data from this text. Return ONLY valid JSON with keys: name, email, phone. Use null for missing values.
 
 Text:
+"""
+
+# Built once; every request reuses these system message dicts.
+_SYSTEM_MSG = {"role": "system", "content": EXTRACTION_SYSTEM}
+
+# Packed prompt: K texts per chat request, so request count (RPM) drops K-fold.
+# Structured outputs only allow a top-level object, hence the "leads" wrapper.
+EXTRACTION_PACKED_SYSTEM = """You extract lead fields from several numbered texts. Return ONLY valid JSON:
+an object {"leads": [...]} with exactly one object per input text, in input order.
+Each object uses exactly these keys: name, email, phone. Use null for any missing value.
+Do not add other keys or text."""
+
+EXTRACTION_PACKED_ITEM_TEMPLATE = """Text {index}:
 {text}
 """
 
+_PACKED_SYSTEM_MSG = {"role": "system", "content": EXTRACTION_PACKED_SYSTEM}
+
+# Structured outputs: the LeadExtraction schema, enforced server-side. Spelled out (rather
+# than passing the model to the SDK's parse()) so the reply can be streamed.
+_LEAD_JSON_SCHEMA: dict[str, Any] = {
+    "type": "object",
+    "properties": {
+        "name": {"type": ["string", "null"]},
+        "email": {"type": ["string", "null"]},
+        "phone": {"type": ["string", "null"]},
+    },
+    "required": ["name", "email", "phone"],
+    "additionalProperties": False,
+}
+
+LEAD_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {"name": "LeadExtraction", "strict": True, "schema": _LEAD_JSON_SCHEMA},
+}
+
+# Packed reply: {"leads": [<LeadExtraction>, ...]}, each item held to the same strict schema.
+PACKED_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "PackedLeadExtraction",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "leads": {"type": "array", "items": _LEAD_JSON_SCHEMA},
+            },
+            "required": ["leads"],
+            "additionalProperties": False,
+        },
+    },
+}
+
 DEFAULT_TIMEOUT_SEC = 30.0
 
-# Isolated LLM boundary: (text) -> raw string; may raise ExtractorError.
-LLMCall = Callable[[str], str]
+# Overall budget per lead across all attempts and backoff. Each attempt gets the remaining
+# budget split over the attempts left, but never less than MIN_ATTEMPT_TIMEOUT_SEC.
+DEFAULT_DEADLINE_SEC = 45.0
+MIN_ATTEMPT_TIMEOUT_SEC = 2.0
+
+DEFAULT_MAX_CONCURRENCY = 10
 
+DEFAULT_PACK_SIZE = 10
 
-def _call_llm(text: str, timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> str:
-    """Call LLM and return raw response content. Raises ExtractorError on failure."""
+# Connection pool for the shared client: keep-alive avoids a TCP+TLS handshake per call.
+HTTP_MAX_CONNECTIONS = 50
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 20
+HTTP_KEEPALIVE_EXPIRY_SEC = 30.0
+
+# LRU of validated leads from the default OpenAI call, keyed by text hash + model.
+# EXTRACTION_CACHE_SIZE=0 disables it.
+DEFAULT_CACHE_SIZE = 10_000
+
+
+def _cache_size_from_env() -> int:
+    value = os.environ.get("EXTRACTION_CACHE_SIZE")
+    if value is None:
+        return DEFAULT_CACHE_SIZE
     try:
-        from openai import OpenAI
-    except ImportError:
-        raise ProviderError("openai package not installed; pip install openai") from None
+        return int(value)
+    except ValueError:
+        logger.warning("invalid EXTRACTION_CACHE_SIZE=%r; using %d", value, DEFAULT_CACHE_SIZE)
+        return DEFAULT_CACHE_SIZE
+
+
+CACHE_MAX_ENTRIES = _cache_size_from_env()
+
+# Pre-filter: short texts with no "@" and fewer than PHONE_DIGITS_MIN digits in total cannot
+# hold a usable contact, so they return EmptyLead without an LLM call.
+MIN_TEXT_LEN_WITHOUT_HINT = 20
+
+# Rough prompt + completion size used to reserve tokens-per-minute before a call.
+PROMPT_OVERHEAD_TOKENS = 200
+
+# Shared by every call in the process; limits are learned from OpenAI response headers.
+_rate_limiter = RateLimiter()
+
+# Isolated LLM boundary: (text) -> raw JSON string or an already-parsed LeadExtraction;
+# may raise ExtractorError. Raw strings go through _parse_and_validate.
+LLMCall = Callable[[str], str | LeadExtraction]
+# Async counterpart used by the batch path.
+AsyncLLMCall = Callable[[str], Awaitable[str | LeadExtraction]]
+# Packed boundary: (texts) -> raw JSON {"leads": [...]} (or a bare array), one item per text.
+PackedLLMCall = Callable[[list[str]], str]
 
+
+def _api_key() -> str:
     api_key = os.environ.get("OPENAI_API_KEY")
     if not api_key:
         raise ProviderError("OPENAI_API_KEY not set")
+    return api_key
+
+
+def _http_limits() -> Any:
+    import httpx
+
+    return httpx.Limits(
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=HTTP_KEEPALIVE_EXPIRY_SEC,
+    )
+
+
+# One OpenAI client per process, rebuilt only when OPENAI_API_KEY changes. Clients are built
+# with max_retries=0: our retry loop (deadline, backoff, RateLimiter) is the only retry layer.
+_client: Any = None
+_client_key: str | None = None
+_client_lock = threading.Lock()
 
-    client = OpenAI(api_key=api_key)
-    user_content = EXTRACTION_USER_TEMPLATE.format(text=text)
 
+def _get_client() -> Any:
+    """Return the shared OpenAI client for the current API key. Raises ProviderError."""
+    global _client, _client_key
     try:
-        response = client.chat.completions.create(
-            model=os.environ.get("OPENAI_EXTRACTION_MODEL", "gpt-4o-mini"),
-            messages=[
-                {"role": "system", "content": EXTRACTION_SYSTEM},
-                {"role": "user", "content": user_content},
-            ],
-            timeout=timeout_sec,
-        )
-    except Exception as e:
-        err_name = type(e).__name__
-        if "timeout" in err_name.lower() or "Timeout" in str(e):
-            raise LLMTimeoutError(str(e))
-        if "Authentication" in str(e) or "api_key" in str(e).lower():
-            raise ProviderError(str(e))
-        raise ProviderError(str(e))
+        import httpx
+        from openai import OpenAI
+    except ImportError:
+        raise ProviderError("openai package not installed; pip install openai") from None
+
+    api_key = _api_key()
+    with _client_lock:
+        if _client is None or _client_key != api_key:
+            if _client is not None:
+                _client.close()
+            _client = OpenAI(
+                api_key=api_key,
+                max_retries=0,
+                http_client=httpx.Client(limits=_http_limits()),
+            )
+            _client_key = api_key
+        return _client
+
+
+def close_client() -> None:
+    """Close the shared OpenAI client and its connection pool. Safe to call repeatedly."""
+    global _client, _client_key
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+        _client = None
+        _client_key = None
+
+
+atexit.register(close_client)
+
+# AsyncOpenAI clients are bound to the event loop they were created on: keep one per loop.
+_async_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple[str, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def _get_async_client() -> Any:
+    """Return the AsyncOpenAI client for the running loop and current API key. Raises ProviderError."""
+    try:
+        import httpx
+        from openai import AsyncOpenAI
+    except ImportError:
+        raise ProviderError("openai package not installed; pip install openai") from None
+
+    api_key = _api_key()
+    loop = asyncio.get_running_loop()
+    stale = None
+    with _client_lock:
+        entry = _async_clients.get(loop)
+        if entry is None or entry[0] != api_key:
+            stale = entry
+            client = AsyncOpenAI(
+                api_key=api_key,
+                max_retries=0,
+                http_client=httpx.AsyncClient(limits=_http_limits()),
+            )
+            entry = _async_clients[loop] = (api_key, client)
+    # Closed outside the lock: it is a threading.Lock and close() awaits.
+    if stale is not None:
+        await stale[1].close()
+    return entry[1]
+
+
+async def aclose_client() -> None:
+    """Close the AsyncOpenAI client bound to the running event loop, if any."""
+    with _client_lock:
+        entry = _async_clients.pop(asyncio.get_running_loop(), None)
+    if entry is not None:
+        await entry[1].close()
+
+
+def _model_name() -> str:
+    return os.environ.get("OPENAI_EXTRACTION_MODEL", "gpt-4o-mini")
+
+
+_lead_cache: OrderedDict[str, LeadExtraction] = OrderedDict()
+_lead_cache_lock = threading.Lock()
+
+
+def _cache_key(text: str) -> str:
+    return hashlib.blake2b(text.encode(), digest_size=16).hexdigest() + ":" + _model_name()
+
+
+def _cache_get(key: str) -> LeadExtraction | None:
+    with _lead_cache_lock:
+        lead = _lead_cache.get(key)
+        if lead is not None:
+            _lead_cache.move_to_end(key)
+        return lead
+
+
+def _cache_put(key: str, lead: LeadExtraction) -> None:
+    if CACHE_MAX_ENTRIES <= 0:
+        return
+    with _lead_cache_lock:
+        _lead_cache[key] = lead
+        _lead_cache.move_to_end(key)
+        while len(_lead_cache) > CACHE_MAX_ENTRIES:
+            _lead_cache.popitem(last=False)
+
+
+def clear_cache() -> None:
+    """Drop all cached leads."""
+    with _lead_cache_lock:
+        _lead_cache.clear()
+
+
+def _obviously_empty(text: str) -> EmptyLead | None:
+    """
+    Return EmptyLead if text cannot contain contact info; None if it needs the LLM.
+    Digits are counted across the whole text, so formatted phone numbers pass.
+
+    >>> _obviously_empty("hello").reason
+    'no email/phone markers'
+    >>> [_obviously_empty(t) for t in ("+1 (555) 123-4567", "call 987-654-3210", "Ravi 98765 43210")]
+    [None, None, None]
+    """
+    if not text or not text.strip():
+        return EmptyLead("blank input")
+    if (
+        len(text) < MIN_TEXT_LEN_WITHOUT_HINT
+        and "@" not in text
+        and sum(c.isdigit() for c in text) < PHONE_DIGITS_MIN
+    ):
+        return EmptyLead("no email/phone markers")
+    return None
+
+
+def _estimate_tokens(text: str) -> int:
+    return len(text) // 4 + PROMPT_OVERHEAD_TOKENS
+
 
+def _exc_map() -> dict[type[BaseException], type[ExtractorError]]:
+    global _EXC_MAP
+    if _EXC_MAP is None:
+        try:
+            import httpx
+            from openai import (
+                APIConnectionError,
+                APITimeoutError,
+                AuthenticationError,
+                RateLimitError,
+            )
+        except ImportError:  # _get_client() reports the missing package as ProviderError
+            _EXC_MAP = {}
+        else:
+            # Mid-stream transport errors surface as raw httpx exceptions, hence those entries.
+            _EXC_MAP = {
+                APITimeoutError: LLMTimeoutError,
+                APIConnectionError: LLMTimeoutError,
+                AuthenticationError: ProviderError,
+                RateLimitError: RateLimited,
+                httpx.TimeoutException: LLMTimeoutError,
+                httpx.TransportError: LLMTimeoutError,
+            }
+    return _EXC_MAP
+
+
+def _provider_error(e: Exception) -> ExtractorError:
+    """Map an exception raised by the OpenAI SDK to a typed ExtractorError."""
+    exc_map = _exc_map()
+    # Walk the MRO so SDK subclasses (e.g. httpx.ReadTimeout) hit their base entry.
+    for cls in type(e).__mro__:
+        error_type = exc_map.get(cls)
+        if error_type is not None:
+            return error_type(str(e))
+    return ProviderError(str(e))
+
+
+def _build_messages(text: str) -> list[dict[str, str]]:
+    """Chat messages for a single-text extraction (shared with the Batch API path)."""
+    return [_SYSTEM_MSG, {"role": "user", "content": EXTRACTION_USER_PREFIX + text + "\n"}]
+
+
+def _response_content(response: Any) -> str:
+    """Return the stripped message content of a chat completion. Raises ModelInvalidOutput."""
     choice = response.choices[0] if response.choices else None
     if not choice or not getattr(choice, "message", None):
         raise ModelInvalidOutput("Empty or missing message in response")
@@ -89,27 +383,232 @@ def _call_llm(text: str, timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> str:
     return content
 
 
-def _parse_and_validate(raw: str) -> LeadExtraction:
-    """Parse JSON and validate with Pydantic. Raises ModelInvalidOutput on any failure."""
+def _append_chunk(buf: bytearray, chunk: Any) -> None:
+    """Append one streamed delta's content to buf. Raises ModelInvalidOutput on refusal."""
+    if not chunk.choices:
+        return
+    delta = chunk.choices[0].delta
+    if getattr(delta, "refusal", None):
+        raise ModelInvalidOutput(f"Model refused: {delta.refusal}")
+    if delta.content:
+        buf += delta.content.encode()
+
+
+def _call_llm(text: str, timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> LeadExtraction:
+    """
+    Call LLM with structured outputs and return the validated lead. Raises ExtractorError.
+    The reply is streamed into a buffer as it arrives and validated once the stream closes.
+    """
+    client = _get_client()
+    buf = bytearray()
+
     try:
-        obj = json.loads(raw)
-    except json.JSONDecodeError as e:
-        raise ModelInvalidOutput(f"Invalid JSON: {e}") from e
+        with client.chat.completions.create(
+            model=_model_name(),
+            messages=_build_messages(text),
+            response_format=LEAD_RESPONSE_FORMAT,
+            stream=True,
+            timeout=timeout_sec,
+        ) as stream:
+            _rate_limiter.update_from_headers(stream.response.headers)
+            for chunk in stream:
+                _append_chunk(buf, chunk)
+    except ExtractorError:
+        raise
+    except Exception as e:
+        raise _provider_error(e)
 
-    if not isinstance(obj, dict):
-        raise ModelInvalidOutput("Response is not a JSON object")
+    if not buf.strip():
+        raise ModelInvalidOutput("Empty message content")
+    return _parse_and_validate(bytes(buf))
+
+
+async def _call_llm_async(text: str, timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> LeadExtraction:
+    """Async variant of _call_llm on the event loop's shared client. Raises ExtractorError."""
+    client = await _get_async_client()
+    buf = bytearray()
 
     try:
-        return LeadExtraction(
-            name=obj.get("name"),
-            email=obj.get("email"),
-            phone=obj.get("phone"),
+        stream = await client.chat.completions.create(
+            model=_model_name(),
+            messages=_build_messages(text),
+            response_format=LEAD_RESPONSE_FORMAT,
+            stream=True,
+            timeout=timeout_sec,
         )
+        async with stream:
+            _rate_limiter.update_from_headers(stream.response.headers)
+            async for chunk in stream:
+                _append_chunk(buf, chunk)
+    except ExtractorError:
+        raise
+    except Exception as e:
+        raise _provider_error(e)
+
+    if not buf.strip():
+        raise ModelInvalidOutput("Empty message content")
+    return _parse_and_validate(bytes(buf))
+
+
+def _call_llm_packed(texts: list[str], timeout_sec: float = DEFAULT_TIMEOUT_SEC) -> str:
+    """Send several texts in one structured-output request; return raw content. Raises ExtractorError."""
+    client = _get_client()
+    user_content = "\n".join(
+        EXTRACTION_PACKED_ITEM_TEMPLATE.format(index=i, text=t) for i, t in enumerate(texts, 1)
+    )
+
+    try:
+        raw = client.chat.completions.with_raw_response.create(
+            model=_model_name(),
+            messages=[_PACKED_SYSTEM_MSG, {"role": "user", "content": user_content}],
+            response_format=PACKED_RESPONSE_FORMAT,
+            timeout=timeout_sec,
+        )
+        _rate_limiter.update_from_headers(raw.headers)
+        completion = raw.parse()
+    except Exception as e:
+        raise _provider_error(e)
+
+    return _response_content(completion)
+
+
+if msgspec is not None:
+
+    class _RawLead(msgspec.Struct):
+        """Typed decode target for raw LLM JSON: no intermediate dict; unknown keys are ignored."""
+
+        name: str | None = None
+        email: str | None = None
+        phone: str | None = None
+
+    _raw_lead_decoder = msgspec.json.Decoder(_RawLead)
+else:
+    _raw_lead_decoder = None
+
+
+def _loads(raw: str | bytes) -> Any:
+    """Decode JSON with orjson when installed, else stdlib json. Raises ValueError."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _parse_and_validate(raw: str | bytes) -> LeadExtraction:
+    """Parse JSON and validate with Pydantic. Raises ModelInvalidOutput on any failure."""
+    if _raw_lead_decoder is not None:
+        # msgspec decodes straight into typed fields and rejects non-object / non-string values.
+        try:
+            fields = _raw_lead_decoder.decode(raw)
+        except msgspec.ValidationError as e:  # subclass of DecodeError: valid JSON, wrong shape
+            raise ModelInvalidOutput(f"Schema validation failed: {e}") from e
+        except msgspec.DecodeError as e:
+            raise ModelInvalidOutput(f"Invalid JSON: {e}") from e
+        name, email, phone = fields.name, fields.email, fields.phone
+    else:
+        try:
+            obj = _loads(raw)
+        except ValueError as e:  # json.JSONDecodeError and orjson.JSONDecodeError
+            raise ModelInvalidOutput(f"Invalid JSON: {e}") from e
+
+        return _lead_from_obj(obj)
+
+    return _lead_from_fields(name, email, phone)
+
+
+def _lead_from_obj(obj: Any) -> LeadExtraction:
+    """Validate one decoded JSON value as a lead. Raises ModelInvalidOutput."""
+    if not isinstance(obj, dict):
+        raise ModelInvalidOutput("Schema validation failed: response is not a JSON object")
+    return _lead_from_fields(obj.get("name"), obj.get("email"), obj.get("phone"))
+
+
+def _lead_from_fields(name: Any, email: Any, phone: Any) -> LeadExtraction:
+    try:
+        return LeadExtraction(name=name, email=email, phone=phone)
     except ValidationError as e:
         raise ModelInvalidOutput(f"Schema validation failed: {e}") from e
 
 
-def extract_lead(text: str, *, llm_call: LLMCall | None = None) -> Result:
+def _parse_packed(raw: str, expected: int) -> list[Any]:
+    """Decode a packed reply into one JSON value per input. Raises ModelInvalidOutput."""
+    try:
+        obj = _loads(raw)
+    except ValueError as e:
+        raise ModelInvalidOutput(f"Invalid JSON: {e}") from e
+
+    items = obj.get("leads") if isinstance(obj, dict) else obj
+    if not isinstance(items, list):
+        raise ModelInvalidOutput("Packed response has no leads array")
+    if len(items) != expected:
+        raise ModelInvalidOutput(f"Packed response has {len(items)} leads, expected {expected}")
+    return items
+
+
+def _validate_lead(output: str | LeadExtraction) -> LeadExtraction:
+    """Parse raw output if needed, then apply the empty-lead policy. Raises ExtractorError."""
+    # The default call returns a parsed lead; injected calls may still return raw JSON.
+    lead = output if isinstance(output, LeadExtraction) else _parse_and_validate(output)
+    # Empty-lead policy: never return Ok when there is no contact info.
+    if not lead.has_contact():
+        raise EmptyLead("No email or phone extracted; lead has no contact info")
+    return lead
+
+
+def _attempt_timeout(deadline_sec: float, start: float, attempt: int) -> float | None:
+    """Timeout for this attempt from the remaining deadline budget; None if it is spent."""
+    remaining = deadline_sec - (time.monotonic() - start)
+    if remaining <= 0:
+        return None
+    return max(MIN_ATTEMPT_TIMEOUT_SEC, remaining / (MAX_RETRIES - attempt))
+
+
+def _deadline_exceeded(deadline_sec: float, start: float, delay: float = 0.0) -> bool:
+    return time.monotonic() - start + delay >= deadline_sec
+
+
+def _deadline_error(last_error: ExtractorError | None) -> LLMTimeoutError:
+    """Deadline failure that keeps the last attempt's failure in its reason."""
+    if last_error is None:
+        return LLMTimeoutError("deadline exceeded")
+    error = LLMTimeoutError(
+        f"deadline exceeded; last failure: {last_error.failure_type.value}: {last_error.reason}"
+    )
+    error.__cause__ = last_error
+    return error
+
+
+def _retry_delay(
+    error: ExtractorError, attempt: int, deadline_sec: float, start: float
+) -> float | ExtractorError:
+    """
+    Decide and log whether to retry a failed attempt. Returns the backoff delay, or the error
+    to give up with: error itself, or a deadline error if the backoff would overrun deadline_sec.
+    """
+    will_retry = with_retry(attempt, MAX_RETRIES) and is_retriable(error)
+    delay = backoff_delay(attempt) if will_retry else 0.0
+    give_up: ExtractorError = error
+    if will_retry and _deadline_exceeded(deadline_sec, start, delay):
+        will_retry = False
+        give_up = _deadline_error(error)
+    log_attempt_failure(
+        attempt=attempt,
+        failure_type=error.failure_type,
+        reason=error.reason,
+        will_retry=will_retry,
+    )
+    if not will_retry:
+        return give_up
+    logger.info("retry in %.1fs", delay)
+    return delay
+
+
+def extract_lead(
+    text: str,
+    *,
+    llm_call: LLMCall | None = None,
+    skip_llm_on_obvious_empty: bool = True,
+    deadline_sec: float = DEFAULT_DEADLINE_SEC,
+) -> Result:
     """
     Extract lead data from raw text. Contract boundary: never returns raw LLM output.
     Returns Ok(LeadExtraction) or Err(ExtractorError). All failures are typed.
@@ -118,35 +617,263 @@ def extract_lead(text: str, *, llm_call: LLMCall | None = None) -> Result:
     Such cases return Err(EmptyLead(...)) so downstream never receives an empty lead.
 
     LLM call is isolated: pass llm_call to inject the LLM (e.g. for tests); side effects
-    (network, env) live only in that callable. If llm_call is None, uses default OpenAI call.
+    (network, env) live only in that callable. If llm_call is None, uses default OpenAI call,
+    whose successful leads are cached by text and model (see clear_cache()).
+
+    With skip_llm_on_obvious_empty (default), blank input and short text with no "@" and
+    fewer than 10 digits return Err(EmptyLead(...)) without calling the LLM.
+
+    deadline_sec bounds the whole call, retries and backoff included. The default OpenAI
+    call gets a per-attempt timeout that shrinks to fit what is left after any rate-limit
+    wait; once the budget is spent (or the next wait or backoff would overrun it) we return
+    Err(LLMTimeoutError(...)) without sleeping, naming the last failure in its reason.
     """
+    if skip_llm_on_obvious_empty and (empty := _obviously_empty(text)) is not None:
+        return Err(empty)
+
     last_error: ExtractorError | None = None
-    call: LLMCall = llm_call if llm_call is not None else _call_llm
+
+    cache_key = _cache_key(text) if llm_call is None else None
+    if cache_key is not None and (cached := _cache_get(cache_key)) is not None:
+        return Ok(cached)
+
+    est_tokens = _estimate_tokens(text)
+    start = time.monotonic()
 
     for attempt in range(MAX_RETRIES):
+        # Wait for rate-limit capacity first, so the attempt timeout is what remains after it.
+        if not _rate_limiter.acquire(est_tokens, deadline=start + deadline_sec):
+            return Err(_deadline_error(last_error))
+        timeout_sec = _attempt_timeout(deadline_sec, start, attempt)
+        if timeout_sec is None:
+            return Err(_deadline_error(last_error))
         try:
-            raw = call(text)
-            lead = _parse_and_validate(raw)
-            # Empty-lead policy: never return Ok when there is no contact info.
-            if not lead.has_contact():
-                raise EmptyLead("No email or phone extracted; lead has no contact info")
+            output = llm_call(text) if llm_call is not None else _call_llm(text, timeout_sec)
+            lead = _validate_lead(output)
+            if cache_key is not None:
+                _cache_put(cache_key, lead)
             return Ok(lead)
         except ExtractorError as e:
             last_error = e
-            will_retry = with_retry(attempt, MAX_RETRIES) and is_retriable(e)
-            log_attempt_failure(
-                attempt=attempt,
-                failure_type=e.failure_type,
-                reason=e.reason,
-                will_retry=will_retry,
-            )
-            if not will_retry:
-                return Err(e)
-            delay = backoff_delay(attempt)
-            logger.info("retry in %.1fs", delay)
-            time.sleep(delay)
+            outcome = _retry_delay(e, attempt, deadline_sec, start)
+            if isinstance(outcome, ExtractorError):
+                return Err(outcome)
+            time.sleep(outcome)
 
     # Exhausted retries; return last error (retriable type)
     return Err(last_error) if last_error else Err(
         ModelInvalidOutput("Max retries exceeded without success")
     )
+
+
+async def extract_lead_async(
+    text: str,
+    *,
+    llm_call: AsyncLLMCall | None = None,
+    skip_llm_on_obvious_empty: bool = True,
+    deadline_sec: float = DEFAULT_DEADLINE_SEC,
+) -> Result:
+    """
+    Async extract_lead: same contract, cache, deadline, retry and empty-lead policy, but backoff and
+    rate-limit waits use asyncio.sleep so the event loop is never blocked. If llm_call is
+    None, uses one pooled AsyncOpenAI client per event loop (see aclose_client()).
+    """
+    if skip_llm_on_obvious_empty and (empty := _obviously_empty(text)) is not None:
+        return Err(empty)
+
+    last_error: ExtractorError | None = None
+
+    cache_key = _cache_key(text) if llm_call is None else None
+    if cache_key is not None and (cached := _cache_get(cache_key)) is not None:
+        return Ok(cached)
+
+    est_tokens = _estimate_tokens(text)
+    start = time.monotonic()
+
+    for attempt in range(MAX_RETRIES):
+        # Wait for rate-limit capacity first, so the attempt timeout is what remains after it.
+        if not await _rate_limiter.acquire_async(est_tokens, deadline=start + deadline_sec):
+            return Err(_deadline_error(last_error))
+        timeout_sec = _attempt_timeout(deadline_sec, start, attempt)
+        if timeout_sec is None:
+            return Err(_deadline_error(last_error))
+        try:
+            if llm_call is not None:
+                output = await llm_call(text)
+            else:
+                output = await _call_llm_async(text, timeout_sec)
+            lead = _validate_lead(output)
+            if cache_key is not None:
+                _cache_put(cache_key, lead)
+            return Ok(lead)
+        except ExtractorError as e:
+            last_error = e
+            outcome = _retry_delay(e, attempt, deadline_sec, start)
+            if isinstance(outcome, ExtractorError):
+                return Err(outcome)
+            await asyncio.sleep(outcome)
+
+    return Err(last_error) if last_error else Err(
+        ModelInvalidOutput("Max retries exceeded without success")
+    )
+
+
+async def extract_leads_async(
+    texts: list[str],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    llm_call: AsyncLLMCall | None = None,
+    skip_llm_on_obvious_empty: bool = True,
+    deadline_sec: float = DEFAULT_DEADLINE_SEC,
+) -> list[Result]:
+    """
+    Extract many leads concurrently. Returns one Result per input, in input order.
+
+    At most max_concurrency LLM calls are in flight at once (asyncio.Semaphore), so wall
+    time approaches the slowest call rather than the sum of all calls. Each text goes
+    through extract_lead_async, so calls share the event loop's AsyncOpenAI client.
+    deadline_sec applies per text and starts once its semaphore slot is acquired.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be >= 1")
+
+    sem = asyncio.Semaphore(max_concurrency)
+
+    async def sem_wrap(text: str) -> Result:
+        async with sem:
+            return await extract_lead_async(
+                text,
+                llm_call=llm_call,
+                skip_llm_on_obvious_empty=skip_llm_on_obvious_empty,
+                deadline_sec=deadline_sec,
+            )
+
+    return list(await asyncio.gather(*[sem_wrap(t) for t in texts]))
+
+
+def extract_leads(
+    texts: list[str],
+    *,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    llm_call: AsyncLLMCall | None = None,
+    skip_llm_on_obvious_empty: bool = True,
+    deadline_sec: float = DEFAULT_DEADLINE_SEC,
+) -> list[Result]:
+    """Sync wrapper around extract_leads_async. Must not be called from a running event loop."""
+
+    async def run() -> list[Result]:
+        try:
+            return await extract_leads_async(
+                texts,
+                max_concurrency=max_concurrency,
+                llm_call=llm_call,
+                skip_llm_on_obvious_empty=skip_llm_on_obvious_empty,
+                deadline_sec=deadline_sec,
+            )
+        finally:
+            # The loop dies with asyncio.run, so its client must be closed here.
+            await aclose_client()
+
+    return asyncio.run(run())
+
+
+def extract_leads_packed(
+    texts: list[str],
+    *,
+    k: int = DEFAULT_PACK_SIZE,
+    packed_call: PackedLLMCall | None = None,
+    llm_call: LLMCall | None = None,
+    skip_llm_on_obvious_empty: bool = True,
+    deadline_sec: float = DEFAULT_DEADLINE_SEC,
+) -> list[Result]:
+    """
+    Extract many short leads with one chat request per k texts. Returns one Result per
+    input, in input order. Use when requests-per-minute, not tokens, is the bottleneck.
+
+    Each item of a packed reply is validated on its own and gets the empty-lead policy.
+    If a packed reply is malformed or has the wrong number of items, every text in that
+    chunk falls back to extract_lead (with its retries); so does any single item that fails
+    validation. Timeouts and rate limits retry the whole chunk with backoff; other provider
+    errors return Err for every text in the chunk. packed_call / llm_call inject the packed
+    and fallback calls (e.g. for tests).
+
+    deadline_sec bounds each chunk's packed attempts like extract_lead's, and is passed to
+    each per-text fallback.
+    """
+    if k < 1:
+        raise ValueError("k must be >= 1")
+
+    results: dict[int, Result] = {}
+    pending: list[int] = []
+    for i, text in enumerate(texts):
+        if skip_llm_on_obvious_empty and (empty := _obviously_empty(text)) is not None:
+            results[i] = Err(empty)
+        elif packed_call is None and (cached := _cache_get(_cache_key(text))) is not None:
+            results[i] = Ok(cached)
+        else:
+            pending.append(i)
+
+    for offset in range(0, len(pending), k):
+        chunk = pending[offset : offset + k]
+        chunk_texts = [texts[i] for i in chunk]
+        est_tokens = sum(_estimate_tokens(t) for t in chunk_texts)
+        items: list[Any] | None = None
+        failure: ExtractorError | None = None
+        start = time.monotonic()
+
+        # Only a malformed reply falls back to per-text calls. Timeouts and rate limits are
+        # retried for the whole chunk; fanning out would multiply requests by k.
+        for attempt in range(MAX_RETRIES):
+            if not _rate_limiter.acquire(est_tokens, deadline=start + deadline_sec):
+                failure = _deadline_error(failure)
+                break
+            timeout_sec = _attempt_timeout(deadline_sec, start, attempt)
+            if timeout_sec is None:
+                failure = _deadline_error(failure)
+                break
+            try:
+                if packed_call is not None:
+                    output = packed_call(chunk_texts)
+                else:
+                    output = _call_llm_packed(chunk_texts, timeout_sec)
+                items = _parse_packed(output, len(chunk))
+                break
+            except ModelInvalidOutput as e:
+                logger.warning("packed reply unusable, falling back to per-text calls: %s", e.reason)
+                items = [None] * len(chunk)
+                break
+            except ExtractorError as e:
+                failure = e
+                outcome = _retry_delay(e, attempt, deadline_sec, start)
+                if isinstance(outcome, ExtractorError):
+                    failure = outcome
+                    break
+                time.sleep(outcome)
+
+        if items is None:
+            # The last attempt is never retried, so failure is always set here.
+            chunk_err = Err(failure or ModelInvalidOutput("Max retries exceeded without success"))
+            for i in chunk:
+                results[i] = chunk_err
+            continue
+
+        for i, item in zip(chunk, items):
+            try:
+                lead = _validate_lead(_lead_from_obj(item))
+            except EmptyLead as e:
+                results[i] = Err(e)
+                continue
+            except ExtractorError:
+                results[i] = extract_lead(
+                    texts[i],
+                    llm_call=llm_call,
+                    skip_llm_on_obvious_empty=False,
+                    deadline_sec=deadline_sec,
+                )
+                continue
+            if packed_call is None:
+                _cache_put(_cache_key(texts[i]), lead)
+            results[i] = Ok(lead)
+
+    # Every index is set above (pre-filter, cache, chunk error or per-item result).
+    return [results[i] for i in range(len(texts))]
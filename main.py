@@ -13,8 +13,7 @@ if __name__ == "__main__" and os.path.dirname(__file__) not in sys.path:
     if parent not in sys.path:
         sys.path.insert(0, parent)
 
-from llm_contract.extractor import extract_lead
-from llm_contract.schemas import Ok, Err
+from llm_contract.extractor import extract_leads
 
 
 DEMO_INPUTS = [
@@ -31,10 +30,10 @@ def main() -> None:
         return
 
     print("--- llm_contract demo ---\n")
-    for label, text in DEMO_INPUTS:
+    results = extract_leads([text for _, text in DEMO_INPUTS])
+    for (label, text), result in zip(DEMO_INPUTS, results):
         print(f"[{label}] input: {text[:60]!r}...")
-        result = extract_lead(text)
-        if isinstance(result, Ok):
+        if result.ok:
             lead = result.value
             payload = lead.to_crm_payload()
             print(f"  -> Ok(name={payload['name']!r}, email={payload['email']!r}, phone={payload['phone']!r})")
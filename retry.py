@@ -1,33 +1,46 @@
 """
-Retry policy: max 3 attempts, exponential backoff. Retry only on invalid output or timeout.
+Retry policy: max 3 attempts, exponential backoff. Retry only on invalid output, timeout or rate limit.
+RateLimiter throttles calls before they are sent so batches wait instead of hitting 429s.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+import os
+import random
+import threading
 import time
+from typing import Mapping
 
 from llm_contract.errors import (
     ExtractorError,
     FailureKind,
     ModelInvalidOutput,
     LLMTimeoutError,
+    RateLimited,
 )
 
 logger = logging.getLogger(__name__)
 
 MAX_RETRIES = 3
 BASE_DELAY_SEC = 1.0
-RETRIABLE_TYPES = (ModelInvalidOutput, LLMTimeoutError)
+RETRIABLE_TYPES = (ModelInvalidOutput, LLMTimeoutError, RateLimited)
+
+_rng = random.SystemRandom()
+
+# Also echo retry failures to stdout, for environments without logging config.
+_PRINT_RETRIES = os.environ.get("EXTRACTION_PRINT_RETRIES", "").lower() in ("1", "true", "yes")
 
 
 def is_retriable(error: ExtractorError) -> bool:
-    """True only for invalid output or timeout."""
+    """True only for invalid output, timeout or rate limit."""
     return type(error) in RETRIABLE_TYPES
 
 
 def backoff_delay(attempt: int) -> float:
-    """Exponential backoff: 1s, 2s, 4s."""
-    return BASE_DELAY_SEC * (2**attempt)
+    """Exponential backoff: 1s, 2s, 4s, each scaled by a random 0.5–1.5 jitter factor.
+    Jitter keeps concurrent clients that failed together from retrying in lockstep."""
+    return BASE_DELAY_SEC * (2**attempt) * _rng.uniform(0.5, 1.5)
 
 
 def with_retry(
@@ -46,9 +59,115 @@ def log_attempt_failure(
     will_retry: bool,
 ) -> None:
     """Log attempt number, failure type, reason, and retry decision."""
-    msg = (
-        f"attempt={attempt + 1} failure_type={failure_type.value!r} reason={reason!r} will_retry={will_retry}"
-    )
-    logger.warning(msg)
-    # Simple print for environments without logging config
-    print(f"[retry] {msg}")
+    if logger.isEnabledFor(logging.WARNING):
+        logger.warning(
+            "attempt=%d failure_type=%r reason=%r will_retry=%s",
+            attempt + 1,
+            failure_type.value,
+            reason,
+            will_retry,
+        )
+    if _PRINT_RETRIES:
+        print(
+            f"[retry] attempt={attempt + 1} failure_type={failure_type.value!r} "
+            f"reason={reason!r} will_retry={will_retry}"
+        )
+
+
+def _header_number(headers: Mapping[str, str], name: str) -> float | None:
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """
+    Token bucket over requests/minute and tokens/minute, shared by all calls in the process.
+
+    Starts unlimited; limits and remaining headroom are learned from OpenAI's
+    x-ratelimit-* response headers via update_from_headers(). Buckets refill continuously
+    from a monotonic clock. acquire() blocks until the request fits or a deadline would pass.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ) -> None:
+        self._lock = threading.Lock()
+        self._rpm = requests_per_minute
+        self._tpm = tokens_per_minute
+        self._requests = requests_per_minute or 0.0
+        self._tokens = tokens_per_minute or 0.0
+        self._last = time.monotonic()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last
+        self._last = now
+        if self._rpm is not None:
+            self._requests = min(self._rpm, self._requests + elapsed * self._rpm / 60.0)
+        if self._tpm is not None:
+            self._tokens = min(self._tpm, self._tokens + elapsed * self._tpm / 60.0)
+
+    def _reserve(self, est_tokens: int) -> float:
+        """Consume capacity and return 0.0, or return seconds to wait before trying again."""
+        with self._lock:
+            self._refill()
+            wait = 0.0
+            if self._rpm is not None and self._requests < 1:
+                wait = (1 - self._requests) * 60.0 / self._rpm
+            # A request larger than the whole bucket waits for a full bucket, not forever.
+            need = min(est_tokens, self._tpm) if self._tpm is not None else 0
+            if self._tpm is not None and self._tokens < need:
+                wait = max(wait, (need - self._tokens) * 60.0 / self._tpm)
+            if wait > 0:
+                return wait
+            if self._rpm is not None:
+                self._requests -= 1
+            if self._tpm is not None:
+                self._tokens -= need
+            return 0.0
+
+    def acquire(self, est_tokens: int, deadline: float | None = None) -> bool:
+        """
+        Block the calling thread until one request of est_tokens fits in both buckets.
+        deadline is a time.monotonic() value: if the wait would reach it, return False at
+        once without consuming capacity. Returns True once the request is admitted.
+        """
+        while (wait := self._reserve(est_tokens)) > 0:
+            if deadline is not None and time.monotonic() + wait >= deadline:
+                return False
+            logger.info("rate limit: waiting %.2fs", wait)
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, est_tokens: int, deadline: float | None = None) -> bool:
+        """Like acquire(), but waits with asyncio.sleep so the event loop keeps running."""
+        while (wait := self._reserve(est_tokens)) > 0:
+            if deadline is not None and time.monotonic() + wait >= deadline:
+                return False
+            logger.info("rate limit: waiting %.2fs", wait)
+            await asyncio.sleep(wait)
+        return True
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        """Adopt limits and remaining headroom from x-ratelimit-* response headers."""
+        limit_requests = _header_number(headers, "x-ratelimit-limit-requests")
+        limit_tokens = _header_number(headers, "x-ratelimit-limit-tokens")
+        remaining_requests = _header_number(headers, "x-ratelimit-remaining-requests")
+        remaining_tokens = _header_number(headers, "x-ratelimit-remaining-tokens")
+        with self._lock:
+            self._refill()
+            if limit_requests:
+                self._rpm = limit_requests
+            if limit_tokens:
+                self._tpm = limit_tokens
+            if remaining_requests is not None and self._rpm is not None:
+                self._requests = min(remaining_requests, self._rpm)
+            if remaining_tokens is not None and self._tpm is not None:
+                self._tokens = min(remaining_tokens, self._tpm)
@@ -4,9 +4,9 @@ Pydantic models for lead extraction. Schema is the contract boundary.
 from __future__ import annotations
 
 import re
-from typing import Generic, TypeVar
+from typing import ClassVar, Generic, Literal, TypeVar
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 # Import at runtime so Err() accepts ExtractorError; errors.py does not import schemas.
 from llm_contract.errors import ExtractorError
@@ -17,18 +17,29 @@ T = TypeVar("T")
 PHONE_DIGITS_MIN = 10
 PHONE_DIGITS_MAX = 15
 
+# Compiled once; validate_phone_format runs per lead.
+_NONDIGIT_RE = re.compile(r"\D")
+# ASCII fast path: str.translate table deleting every non-digit ASCII char.
+_KEEP_DIGITS = str.maketrans("", "", "".join(chr(c) for c in range(128) if not chr(c).isdigit()))
+
+# Email: syntactic gate only (local@domain.tld), no DNS or Unicode normalization.
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
 
 class LeadExtraction(BaseModel):
-    """Extracted lead fields. All optional to support partial input."""
+    """Extracted lead fields. All optional to support partial input.
+    Frozen: cached leads are shared between callers, so they must not be mutated."""
+
+    model_config = ConfigDict(frozen=True)
 
     name: str | None = Field(default=None, description="Full or display name")
-    email: EmailStr | None = Field(default=None, description="Email address (valid format if present)")
+    email: str | None = Field(default=None, description="Email address (valid format if present)")
     phone: str | None = Field(default=None, description="Phone number, digits only, 10–15 chars")
 
     @field_validator("email", mode="before")
     @classmethod
     def email_empty_to_none(cls, v: str | None) -> str | None:
-        """Normalize empty/whitespace to None so EmailStr validation applies only when present."""
+        """Normalize empty/whitespace to None so format validation applies only when present."""
         if v is None:
             return None
         if isinstance(v, str):
@@ -36,14 +47,26 @@ class LeadExtraction(BaseModel):
             return s if s else None
         return v
 
+    @field_validator("email")
+    @classmethod
+    def validate_email_format(cls, v: str | None) -> str | None:
+        if v is not None and not _EMAIL_RE.match(v):
+            raise ValueError("Email must look like local@domain.tld")
+        return v
+
     @field_validator("phone", mode="before")
     @classmethod
-    def validate_phone_format(cls, v: str | None) -> str | None:
-        if v is None or (isinstance(v, str) and not v.strip()):
+    def validate_phone_format(cls, v: object) -> str | None:
+        if v is None:
             return None
+        # Runs before type validation, so a non-string (e.g. a JSON number) must be rejected here.
+        if not isinstance(v, str):
+            raise ValueError("Phone must be a string")
         s = v.strip()
+        if not s:
+            return None
         # Normalize: keep only digits (strip spaces, dashes, parens, +prefix)
-        digits = re.sub(r"\D", "", s)
+        digits = s.translate(_KEEP_DIGITS) if s.isascii() else _NONDIGIT_RE.sub("", s)
         if not digits:
             raise ValueError("Phone must contain digits")
         if len(digits) < PHONE_DIGITS_MIN or len(digits) > PHONE_DIGITS_MAX:
@@ -58,11 +81,15 @@ class LeadExtraction(BaseModel):
 
     def to_crm_payload(self) -> dict[str, str | None]:
         """Safe for CRM insert: only schema fields, no raw LLM output."""
-        return self.model_dump()
+        # Explicit dict instead of model_dump(): three known fields, no serializer walk.
+        return {"name": self.name, "email": self.email, "phone": self.phone}
 
 
 class Ok(Generic[T]):
-    """Success result."""
+    """Success result. Dispatch on result.ok rather than isinstance(result, Ok)."""
+
+    __slots__ = ("value",)
+    ok: ClassVar[Literal[True]] = True
 
     def __init__(self, value: T) -> None:
         self.value = value
@@ -74,6 +101,9 @@ class Ok(Generic[T]):
 class Err:
     """Error result. Holds typed failure, never raw text."""
 
+    __slots__ = ("error",)
+    ok: ClassVar[Literal[False]] = False
+
     def __init__(self, error: ExtractorError) -> None:
         self.error = error
 